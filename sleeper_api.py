@@ -175,6 +175,7 @@ def get_roster_positions_summary(league_details: Dict) -> Dict[str, int]:
 
     return position_counts
 
+@st.cache_data(ttl=1800)
 def get_scoring_summary(league_details: Dict) -> pd.DataFrame:
     """
     Convert scoring_settings into a readable DataFrame.
@@ -208,6 +209,7 @@ def get_scoring_summary(league_details: Dict) -> pd.DataFrame:
 
     return pd.DataFrame(data)
 
+@st.cache_data(ttl=1800)
 def get_future_picks_inventory(league_id: str, league_details: Dict, rosters: List[Dict],
                                  users: List[Dict], traded_picks: List[Dict]) -> pd.DataFrame:
     """
@@ -349,6 +351,7 @@ def calculate_optimal_starter_count(league_details: Dict) -> Dict[str, int]:
 
     return starter_counts
 
+@st.cache_data(ttl=1800)
 def get_recent_transactions_summary(league_id: str, weeks: int = 4) -> Dict:
     """
     Fetch recent transactions and summarize activity.